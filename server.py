@@ -7,11 +7,21 @@ Provides tools for time tracking management.
 """
 
 import os
+import atexit
 import base64
-from typing import Any, Dict, List, Optional
+import calendar
+import itertools
+import random
+import re
+import time
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import aiohttp
 import asyncio
+import ijson
+import orjson
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.prompts import base
@@ -25,24 +35,49 @@ mcp = FastMCP("Toggl Track")
 # Toggl Track API configuration
 TOGGL_API_BASE = "https://api.track.toggl.com/api/v9"
 
+# How many times to retry a rate-limited request before giving up
+MAX_RETRIES = 3
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """How long to sleep before retrying a rate-limited request
+
+    Honors the Retry-After header when present, otherwise backs off
+    exponentially with jitter, capped at 60 seconds.
+    """
+    if retry_after:
+        try:
+            return min(60.0, float(retry_after))
+        except ValueError:
+            pass
+    return min(60.0, 2 ** attempt + random.random())
+
 
 class TogglClient:
     """Client for interacting with Toggl Track API"""
     
     def __init__(self, api_token: str):
         self.api_token = api_token
+        # Encode the API token with base64 for Basic auth once up front
+        # Toggl API requires format: api_token:api_token
+        auth_string = f"{api_token}:api_token"
+        self._auth_header = "Basic " + base64.b64encode(auth_string.encode()).decode()
         self.session: Optional[aiohttp.ClientSession] = None
-    
+
     async def __aenter__(self):
-        # Encode the API token with base64 for Basic auth
-        # Toggl API requires format: api_token:api_token
-        auth_string = f"{self.api_token}:api_token"
-        encoded_auth = base64.b64encode(auth_string.encode()).decode()
-        
+        # All traffic goes to the single Toggl API host, so keep a pool of
+        # warm keep-alive connections there for the concurrent fetches
         self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            ),
+            timeout=aiohttp.ClientTimeout(total=30, connect=10),
             headers={
                 "Content-Type": "application/json",
-                "Authorization": f"Basic {encoded_auth}"
+                "Authorization": self._auth_header
             }
         )
         return self
@@ -51,32 +86,38 @@ class TogglClient:
         if self.session:
             await self.session.close()
     
-    async def get_projects(self) -> List[Dict[str, Any]]:
-        """Get all projects for the authenticated user"""
+    async def _request(self, method: str, url: str, error_label: str,
+                       params: Optional[Dict[str, Any]] = None,
+                       json_data: Optional[Dict[str, Any]] = None,
+                       none_on_404: bool = False) -> Any:
+        """Issue a request, retrying transient rate-limit responses
+
+        A 429 is retried up to MAX_RETRIES times with backoff so a burst
+        of concurrent tool calls degrades gracefully instead of failing.
+        """
         if not self.session:
             raise RuntimeError("Client not initialized. Use async context manager.")
-        
-        url = f"{TOGGL_API_BASE}/me/projects"
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
+
+        for attempt in range(MAX_RETRIES + 1):
+            async with self.session.request(method, url, params=params, json=json_data) as response:
+                if response.status == 429 and attempt < MAX_RETRIES:
+                    await asyncio.sleep(_retry_delay(response.headers.get("Retry-After"), attempt))
+                    continue
+                if response.status in (200, 201):
+                    return orjson.loads(await response.read())
+                if none_on_404 and response.status == 404:
+                    return None
                 error_text = await response.text()
-                raise Exception(f"Failed to get projects: {response.status} - {error_text}")
-    
+                raise Exception(f"Failed to {error_label}: {response.status} - {error_text}")
+
+    async def get_projects(self) -> List[Dict[str, Any]]:
+        """Get all projects for the authenticated user"""
+        return await self._request("GET", f"{TOGGL_API_BASE}/me/projects", "get projects")
+
     async def get_workspaces(self) -> List[Dict[str, Any]]:
         """Get all workspaces for the authenticated user"""
-        if not self.session:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-        
-        url = f"{TOGGL_API_BASE}/workspaces"
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                error_text = await response.text()
-                raise Exception(f"Failed to get workspaces: {response.status} - {error_text}")
-    
+        return await self._request("GET", f"{TOGGL_API_BASE}/workspaces", "get workspaces")
+
     async def get_time_entries(self, start_date: Optional[str] = None, end_date: Optional[str] = None, 
                               project_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
         """Get time entries for the authenticated user with optional filters
@@ -86,46 +127,80 @@ class TogglClient:
             end_date: End date in YYYY-MM-DD format  
             project_ids: List of project IDs to filter by
         """
+        url = f"{TOGGL_API_BASE}/me/time_entries"
+        params = {}
+
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        if project_ids:
+            # Push the filter server-side so the payload only contains
+            # matching entries
+            params["project_ids"] = ",".join(map(str, project_ids))
+
+        entries = await self._request("GET", url, "get time entries", params=params)
+
+        # Re-filter locally in case the API ignores the parameter;
+        # a set makes the membership test O(1) per entry
+        if project_ids:
+            project_ids_set = set(project_ids)
+            entries = [entry for entry in entries if entry.get("project_id") in project_ids_set]
+
+        return entries
+
+    async def iter_time_entries(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                                project_ids: Optional[List[int]] = None):
+        """Stream time entries, yielding each one as it is parsed off the wire
+
+        Incremental decoding lets filtering and aggregation overlap the
+        download instead of buffering the whole payload first.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            project_ids: List of project IDs to filter by
+        """
         if not self.session:
             raise RuntimeError("Client not initialized. Use async context manager.")
-        
+
         url = f"{TOGGL_API_BASE}/me/time_entries"
         params = {}
-        
+
         if start_date:
             params["start_date"] = start_date
         if end_date:
             params["end_date"] = end_date
-            
-        async with self.session.get(url, params=params) as response:
-            if response.status == 200:
-                entries = await response.json()
-                
-                # Filter by project IDs if specified
-                if project_ids:
-                    entries = [entry for entry in entries if entry.get("project_id") in project_ids]
-                
-                return entries
-            else:
-                error_text = await response.text()
-                raise Exception(f"Failed to get time entries: {response.status} - {error_text}")
-    
+        if project_ids:
+            # Push the filter server-side so the payload only contains
+            # matching entries
+            params["project_ids"] = ",".join(map(str, project_ids))
+
+        # A set makes the per-entry membership test O(1)
+        project_ids_set = set(project_ids) if project_ids else None
+
+        for attempt in range(MAX_RETRIES + 1):
+            async with self.session.get(url, params=params) as response:
+                if response.status == 429 and attempt < MAX_RETRIES:
+                    await asyncio.sleep(_retry_delay(response.headers.get("Retry-After"), attempt))
+                    continue
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(f"Failed to get time entries: {response.status} - {error_text}")
+
+                async for entry in ijson.items(response.content, "item"):
+                    # Re-filter locally in case the API ignores the parameter
+                    if project_ids_set and entry.get("project_id") not in project_ids_set:
+                        continue
+                    yield entry
+                return
+
     async def get_current_time_entry(self) -> Optional[Dict[str, Any]]:
-        """Get the currently running time entry"""
-        if not self.session:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-        
+        """Get the currently running time entry, or None if there is none"""
         url = f"{TOGGL_API_BASE}/me/time_entries/current"
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                result = await response.json()
-                return result
-            elif response.status == 404:
-                return None  # No running entry
-            else:
-                error_text = await response.text()
-                raise Exception(f"Failed to get current time entry: {response.status} - {error_text}")
-    
+        return await self._request("GET", url, "get current time entry", none_on_404=True)
+
+
     async def start_timer(self, workspace_id: int, description: str, project_id: Optional[int] = None) -> Dict[str, Any]:
         """Start a new timer
         
@@ -134,9 +209,6 @@ class TogglClient:
             description: Description for the time entry
             project_id: Optional project ID to assign the time entry to
         """
-        if not self.session:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-        
         # Create time entry data
         now = datetime.utcnow().isoformat() + "Z"
         data = {
@@ -154,12 +226,7 @@ class TogglClient:
             data["project_id"] = project_id
         
         url = f"{TOGGL_API_BASE}/workspaces/{workspace_id}/time_entries"
-        async with self.session.post(url, json=data) as response:
-            if response.status in [200, 201]:
-                return await response.json()
-            else:
-                error_text = await response.text()
-                raise Exception(f"Failed to start timer: {response.status} - {error_text}")
+        return await self._request("POST", url, "start timer", json_data=data)
     
     async def stop_timer(self, workspace_id: int, time_entry_id: int) -> Dict[str, Any]:
         """Stop a running timer
@@ -168,16 +235,8 @@ class TogglClient:
             workspace_id: ID of the workspace
             time_entry_id: ID of the time entry to stop
         """
-        if not self.session:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-        
         url = f"{TOGGL_API_BASE}/workspaces/{workspace_id}/time_entries/{time_entry_id}/stop"
-        async with self.session.patch(url) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                error_text = await response.text()
-                raise Exception(f"Failed to stop timer: {response.status} - {error_text}")
+        return await self._request("PATCH", url, "stop timer")
     
     async def get_tasks(self, workspace_id: int, project_id: int) -> List[Dict[str, Any]]:
         """Get all tasks for a project
@@ -186,16 +245,8 @@ class TogglClient:
             workspace_id: ID of the workspace
             project_id: ID of the project
         """
-        if not self.session:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-        
         url = f"{TOGGL_API_BASE}/workspaces/{workspace_id}/projects/{project_id}/tasks"
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                error_text = await response.text()
-                raise Exception(f"Failed to get tasks: {response.status} - {error_text}")
+        return await self._request("GET", url, "get tasks")
     
     async def create_task(self, workspace_id: int, project_id: int, name: str, 
                          estimated_seconds: Optional[int] = None, active: bool = True) -> Dict[str, Any]:
@@ -208,28 +259,25 @@ class TogglClient:
             estimated_seconds: Estimated time in seconds (optional)
             active: Whether the task is active (default: True)
         """
-        if not self.session:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-        
         data = {
             "name": name,
             "active": active
         }
-        
+
         if estimated_seconds is not None:
             data["estimated_seconds"] = estimated_seconds
-        
+
         url = f"{TOGGL_API_BASE}/workspaces/{workspace_id}/projects/{project_id}/tasks"
-        async with self.session.post(url, json=data) as response:
-            if response.status in [200, 201]:
-                return await response.json()
-            else:
-                error_text = await response.text()
-                raise Exception(f"Failed to create task: {response.status} - {error_text}")
+        return await self._request("POST", url, "create task", json_data=data)
 
 
+@lru_cache(maxsize=1)
 def get_api_token() -> str:
-    """Get Toggl API token from environment variable"""
+    """Get Toggl API token from environment variable
+
+    The token never changes at runtime, so the lookup is cached for the
+    life of the process.
+    """
     token = os.getenv("TOGGL_API_TOKEN")
     if not token:
         raise ValueError(
@@ -239,6 +287,188 @@ def get_api_token() -> str:
     return token
 
 
+def _ymd(d: datetime) -> str:
+    """Format a datetime as YYYY-MM-DD, skipping strftime's locale machinery"""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def _resolve_date_range(start_date: str, end_date: str, default_days: int):
+    """Fill in missing endpoints of a YYYY-MM-DD date range
+
+    Defaults to the last `default_days` days ending today; a lone end
+    date is padded back by the same window.
+    """
+    if not start_date and not end_date:
+        now = datetime.now()
+        end_date = _ymd(now)
+        start_date = _ymd(now - timedelta(days=default_days))
+    elif not start_date:
+        start_date = _ymd(datetime.fromisoformat(end_date) - timedelta(days=default_days))
+    elif not end_date:
+        end_date = _ymd(datetime.now())
+    return start_date, end_date
+
+
+@lru_cache(maxsize=2048)
+def _fmt_hm(seconds: int) -> str:
+    """Format a duration in seconds as 'Xh Ym' with a single division
+
+    Durations cluster heavily (pomodoros, hour blocks), so memoizing
+    skips the divmod and f-string for repeated values.
+    """
+    hours, rem = divmod(seconds, 3600)
+    return f"{hours}h {rem // 60}m"
+
+
+def _entry_start(entry: Dict[str, Any]) -> str:
+    """Sort key: a time entry's ISO start timestamp"""
+    return entry.get("start") or ""
+
+
+def _entry_date(entry: Dict[str, Any]) -> str:
+    """Group key: the YYYY-MM-DD date of a time entry's start"""
+    return (entry.get("start") or "")[:10] or "Unknown date"
+
+
+def _project_names_preview(names, limit: int = 20) -> str:
+    """Join project names for an error message, capped at `limit` entries
+
+    Large workspaces can have hundreds of projects; listing them all
+    bloats the error string for no benefit.
+    """
+    names = list(names)
+    if len(names) <= limit:
+        return ", ".join(names)
+    return f"{', '.join(names[:limit])} (+{len(names) - limit} more)"
+
+
+def _iter_date_sections(entries_by_date, daily_totals, id_to_name):
+    """Yield one formatted block per date, in chronological order
+
+    A generator so each date's block is built independently; if FastMCP
+    grows streaming tool responses these chunks can be flushed as they
+    are produced instead of joined into one string.
+    """
+    for date, day_entries in sorted(entries_by_date.items()):
+        lines = [f"**{date}**\n"]
+
+        for entry in day_entries:
+            description = entry.get("description", "No description")
+            duration = entry.get("duration", 0)
+
+            duration_str = _fmt_hm(duration) if duration > 0 else "Running"
+
+            project_name_display = id_to_name.get(entry.get("project_id"), "No project")
+
+            # Single fetch of "start", single replace (ISO-8601 has one 'T')
+            s = entry.get("start") or ""
+            start_display = s[:16].replace("T", " ", 1)
+
+            lines.append(f"  • {start_display} | {project_name_display} | {description} | {duration_str}\n")
+
+        daily_total = daily_totals[date]
+        if daily_total > 0:
+            lines.append(f"  **Daily Total: {_fmt_hm(daily_total)}**\n")
+
+        lines.append("\n")
+        yield "".join(lines)
+
+
+# Shared client so tool calls reuse one pooled keep-alive session instead of
+# paying a fresh TCP+TLS handshake per invocation
+_client: Optional[TogglClient] = None
+
+
+async def get_client() -> TogglClient:
+    """Get the shared TogglClient, creating its session on first use"""
+    global _client
+    if _client is None:
+        client = TogglClient(get_api_token())
+        await client.__aenter__()
+        _client = client
+    return _client
+
+
+def _close_client():
+    """Close the shared session at process exit"""
+    global _client
+    if _client is not None:
+        try:
+            asyncio.run(_client.__aexit__(None, None, None))
+        except RuntimeError:
+            pass  # No usable event loop during interpreter shutdown
+        _client = None
+
+
+atexit.register(_close_client)
+
+
+# In-process TTL cache for rarely-changing metadata, so the hot path of
+# translating IDs to names skips the network entirely
+CACHE_TTL = float(os.getenv("TOGGL_CACHE_TTL", "60"))
+
+_metadata_cache: Dict[str, Any] = {}  # key -> (expires_at, value)
+_cache_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# Negative cache: projects whose task endpoint recently failed (tasks
+# feature disabled, missing permissions, ...) are skipped for a while
+# instead of re-issuing a request that is known to fail
+NO_TASKS_TTL = 600.0
+_no_tasks_cache: Dict[Tuple[int, int], float] = {}  # (workspace_id, project_id) -> expires_at
+
+
+async def _get_cached(key: str, fetch, ttl: float):
+    """Serve `key` from the metadata cache, refreshing via `fetch` on a miss
+
+    A per-key lock keeps concurrent callers from issuing duplicate
+    refresh requests without serializing fetches of different keys.
+    """
+    cached = _metadata_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    async with _cache_locks[key]:
+        # Re-check after acquiring; another task may have refreshed
+        cached = _metadata_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        value = await fetch()
+        _metadata_cache[key] = (time.monotonic() + ttl, value)
+        return value
+
+
+async def get_projects_cached(client: TogglClient, ttl: float = CACHE_TTL) -> List[Dict[str, Any]]:
+    """Get projects, serving from the in-process cache while it is fresh"""
+    return await _get_cached("projects", client.get_projects, ttl)
+
+
+async def get_workspaces_cached(client: TogglClient, ttl: float = CACHE_TTL) -> List[Dict[str, Any]]:
+    """Get workspaces, serving from the in-process cache while it is fresh"""
+    return await _get_cached("workspaces", client.get_workspaces, ttl)
+
+
+async def get_tasks_cached(client: TogglClient, workspace_id: int, project_id: int,
+                           ttl: float = CACHE_TTL) -> List[Dict[str, Any]]:
+    """Get a project's tasks, serving from the in-process cache while fresh"""
+    return await _get_cached(
+        f"tasks:{workspace_id}:{project_id}",
+        lambda: client.get_tasks(workspace_id, project_id),
+        ttl
+    )
+
+
+async def _prewarm() -> None:
+    """Populate the projects and workspaces caches before serving
+
+    Uses a short-lived client so nothing stays bound to the prewarm
+    event loop; only the (loop-agnostic) cache entries survive.
+    """
+    async with TogglClient(get_api_token()) as client:
+        await asyncio.gather(
+            get_projects_cached(client),
+            get_workspaces_cached(client),
+        )
+
+
 @mcp.tool()
 async def get_projects() -> str:
     """
@@ -247,31 +477,29 @@ async def get_projects() -> str:
     Returns a formatted list of projects with their details.
     """
     try:
-        api_token = get_api_token()
-        
-        async with TogglClient(api_token) as client:
-            projects = await client.get_projects()
-            
-            if not projects:
-                return "No projects found in your Toggl Track account."
-            
-            # Format the projects for display
-            result = "Your Toggl Track Projects:\n\n"
-            for project in projects:
-                name = project.get("name", "Unnamed Project")
-                workspace_id = project.get("workspace_id", "Unknown")
-                color = project.get("color", "No color")
-                is_private = project.get("is_private", False)
-                client_name = project.get("client", {}).get("name", "No client") if project.get("client") else "No client"
-                
-                result += f"• **{name}**\n"
-                result += f"  - Workspace ID: {workspace_id}\n"
-                result += f"  - Client: {client_name}\n"
-                result += f"  - Color: {color}\n"
-                result += f"  - Private: {'Yes' if is_private else 'No'}\n\n"
-            
-            return result
-            
+        client = await get_client()
+        projects = await client.get_projects()
+
+        if not projects:
+            return "No projects found in your Toggl Track account."
+
+        # Format the projects for display
+        parts = ["Your Toggl Track Projects:\n\n"]
+        for project in projects:
+            name = project.get("name", "Unnamed Project")
+            workspace_id = project.get("workspace_id", "Unknown")
+            color = project.get("color", "No color")
+            is_private = project.get("is_private", False)
+            client_name = project.get("client", {}).get("name", "No client") if project.get("client") else "No client"
+
+            parts.append(f"• **{name}**\n")
+            parts.append(f"  - Workspace ID: {workspace_id}\n")
+            parts.append(f"  - Client: {client_name}\n")
+            parts.append(f"  - Color: {color}\n")
+            parts.append(f"  - Private: {'Yes' if is_private else 'No'}\n\n")
+
+        return "".join(parts)
+
     except ValueError as e:
         return f"Configuration error: {str(e)}"
     except Exception as e:
@@ -286,24 +514,22 @@ async def get_workspaces() -> str:
     Returns a formatted list of workspaces with their details.
     """
     try:
-        api_token = get_api_token()
-        
-        async with TogglClient(api_token) as client:
-            workspaces = await client.get_workspaces()
-            
-            if not workspaces:
-                return "No workspaces found in your Toggl Track account."
-            
-            # Format the workspaces for display
-            result = "Your Toggl Track Workspaces:\n\n"
-            for workspace in workspaces:
-                name = workspace.get("name", "Unnamed Workspace")
-                workspace_id = workspace.get("id", "Unknown")
-                
-                result += f"• **{name}** (ID: {workspace_id})\n"
-            
-            return result
-            
+        client = await get_client()
+        workspaces = await client.get_workspaces()
+
+        if not workspaces:
+            return "No workspaces found in your Toggl Track account."
+
+        # Format the workspaces for display
+        parts = ["Your Toggl Track Workspaces:\n\n"]
+        for workspace in workspaces:
+            name = workspace.get("name", "Unnamed Workspace")
+            workspace_id = workspace.get("id", "Unknown")
+
+            parts.append(f"• **{name}** (ID: {workspace_id})\n")
+
+        return "".join(parts)
+
     except ValueError as e:
         return f"Configuration error: {str(e)}"
     except Exception as e:
@@ -323,92 +549,62 @@ async def get_time_entries(start_date: str = "", end_date: str = "", project_nam
     Returns a detailed list of time entries with descriptions and durations.
     """
     try:
-        api_token = get_api_token()
-        
         # Set default date range if not provided
-        if not start_date and not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
-            start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-        elif not start_date:
-            start_date = (datetime.strptime(end_date, "%Y-%m-%d") - timedelta(days=7)).strftime("%Y-%m-%d")
-        elif not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
+        start_date, end_date = _resolve_date_range(start_date, end_date, 7)
         
-        async with TogglClient(api_token) as client:
-            # Get projects first to match project names to IDs
-            projects = await client.get_projects()
+        client = await get_client()
+        project_ids = None
+        projects_task = None
+        if project_name:
+            # Project filter needs the project list before the entries query
+            projects = await get_projects_cached(client)
             project_map = {p.get("name", ""): p.get("id") for p in projects}
-            
-            # Filter by project if specified
-            project_ids = None
-            if project_name:
-                project_id = project_map.get(project_name)
-                if project_id:
-                    project_ids = [project_id]
-                else:
-                    return f"Project '{project_name}' not found. Available projects: {', '.join(project_map.keys())}"
-            
-            # Get time entries
-            entries = await client.get_time_entries(start_date, end_date, project_ids)
-            
-            if not entries:
-                date_range = f"from {start_date} to {end_date}"
-                if project_name:
-                    date_range += f" for project '{project_name}'"
-                return f"No time entries found {date_range}."
-            
-            # Format the entries for display
-            result = f"Time Entries ({start_date} to {end_date}):\n\n"
-            
-            # Group entries by date
-            entries_by_date = {}
-            for entry in entries:
+
+            project_id = project_map.get(project_name)
+            if project_id:
+                project_ids = [project_id]
+            else:
+                return f"Project '{project_name}' not found. Available projects: {', '.join(project_map.keys())}"
+        else:
+            # The fetches are independent, so overlap the project fetch
+            # with the streamed entries download
+            projects_task = asyncio.create_task(get_projects_cached(client))
+
+        # Group entries by date and accumulate daily totals in one pass
+        # as they arrive off the wire
+        entries_by_date = defaultdict(list)
+        daily_totals = defaultdict(int)
+        try:
+            async for entry in client.iter_time_entries(start_date, end_date, project_ids):
                 start_time = entry.get("start", "")
                 date = start_time[:10] if start_time else "Unknown date"
-                if date not in entries_by_date:
-                    entries_by_date[date] = []
                 entries_by_date[date].append(entry)
-            
-            # Sort dates
-            for date in sorted(entries_by_date.keys()):
-                result += f"**{date}**\n"
-                daily_total = 0
-                
-                for entry in entries_by_date[date]:
-                    description = entry.get("description", "No description")
-                    duration = entry.get("duration", 0)
-                    
-                    # Convert duration from seconds to hours and minutes
-                    if duration > 0:
-                        hours = duration // 3600
-                        minutes = (duration % 3600) // 60
-                        duration_str = f"{hours}h {minutes}m"
-                        daily_total += duration
-                    else:
-                        duration_str = "Running"
-                    
-                    # Get project name
-                    project_id = entry.get("project_id")
-                    project_name_display = "No project"
-                    for project in projects:
-                        if project.get("id") == project_id:
-                            project_name_display = project.get("name", "Unknown project")
-                            break
-                    
-                    start_time = entry.get("start", "")[:16].replace("T", " ") if entry.get("start") else ""
-                    
-                    result += f"  • {start_time} | {project_name_display} | {description} | {duration_str}\n"
-                
-                # Daily total
-                if daily_total > 0:
-                    total_hours = daily_total // 3600
-                    total_minutes = (daily_total % 3600) // 60
-                    result += f"  **Daily Total: {total_hours}h {total_minutes}m**\n"
-                
-                result += "\n"
-            
-            return result
-            
+                duration = entry.get("duration", 0)
+                if duration > 0:
+                    daily_totals[date] += duration
+
+            if projects_task is not None:
+                projects = await projects_task
+        except BaseException:
+            if projects_task is not None:
+                projects_task.cancel()
+            raise
+
+        if not entries_by_date:
+            date_range = f"from {start_date} to {end_date}"
+            if project_name:
+                date_range += f" for project '{project_name}'"
+            return f"No time entries found {date_range}."
+
+        # Build the id->name lookup once instead of scanning projects per entry
+        id_to_name = {p.get("id"): p.get("name", "Unknown project") for p in projects}
+
+        # Format the entries for display, one chunk per date
+        parts = [f"Time Entries ({start_date} to {end_date}):\n\n"]
+        parts.extend(_iter_date_sections(entries_by_date, daily_totals, id_to_name))
+
+        return "".join(parts)
+
     except ValueError as e:
         return f"Configuration error: {str(e)}"
     except Exception as e:
@@ -428,82 +624,82 @@ async def get_time_summary(start_date: str = "", end_date: str = "", project_nam
     Returns an aggregated summary of time worked by project.
     """
     try:
-        api_token = get_api_token()
-        
         # Set default date range if not provided
-        if not start_date and not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
-            start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-        elif not start_date:
-            start_date = (datetime.strptime(end_date, "%Y-%m-%d") - timedelta(days=7)).strftime("%Y-%m-%d")
-        elif not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
+        start_date, end_date = _resolve_date_range(start_date, end_date, 7)
         
-        async with TogglClient(api_token) as client:
-            # Get projects first
-            projects = await client.get_projects()
-            project_map = {p.get("id"): p.get("name", "Unknown") for p in projects}
-            
-            # Filter by project if specified
-            project_ids = None
-            if project_name:
-                project_id_match = None
-                for p in projects:
-                    if p.get("name") == project_name:
-                        project_id_match = p.get("id")
-                        break
-                        
-                if project_id_match:
-                    project_ids = [project_id_match]
-                else:
-                    return f"Project '{project_name}' not found. Available projects: {', '.join([p.get('name', '') for p in projects])}"
-            
-            # Get time entries
-            entries = await client.get_time_entries(start_date, end_date, project_ids)
-            
-            if not entries:
-                date_range = f"from {start_date} to {end_date}"
-                if project_name:
-                    date_range += f" for project '{project_name}'"
-                return f"No time entries found {date_range}."
-            
-            # Aggregate by project
-            project_totals = {}
-            grand_total = 0
-            
-            for entry in entries:
-                project_id = entry.get("project_id")
+        client = await get_client()
+        project_ids = None
+        projects_task = None
+        if project_name:
+            # Project filter needs the project list before the entries query
+            projects = await get_projects_cached(client)
+
+            project_id_match = None
+            for p in projects:
+                if p.get("name") == project_name:
+                    project_id_match = p.get("id")
+                    break
+
+            if project_id_match:
+                project_ids = [project_id_match]
+            else:
+                return f"Project '{project_name}' not found. Available projects: {', '.join([p.get('name', '') for p in projects])}"
+        else:
+            # The fetches are independent, so overlap the project fetch
+            # with the streamed entries download
+            projects_task = asyncio.create_task(get_projects_cached(client))
+
+        # Aggregate by project id while entries stream in, without
+        # materializing the full list
+        id_totals = {}
+        grand_total = 0
+        entry_count = 0
+        try:
+            async for entry in client.iter_time_entries(start_date, end_date, project_ids):
+                entry_count += 1
                 duration = entry.get("duration", 0)
-                
+
                 if duration > 0:  # Only count completed entries
-                    project_name_display = project_map.get(project_id, "No project")
-                    
-                    if project_name_display not in project_totals:
-                        project_totals[project_name_display] = 0
-                    
-                    project_totals[project_name_display] += duration
+                    project_id = entry.get("project_id")
+                    id_totals[project_id] = id_totals.get(project_id, 0) + duration
                     grand_total += duration
-            
-            # Format the summary
-            result = f"Time Summary ({start_date} to {end_date}):\n\n"
-            
-            # Sort projects by time spent (descending)
-            sorted_projects = sorted(project_totals.items(), key=lambda x: x[1], reverse=True)
-            
-            for project_name_display, total_seconds in sorted_projects:
-                hours = total_seconds // 3600
-                minutes = (total_seconds % 3600) // 60
-                percentage = (total_seconds / grand_total * 100) if grand_total > 0 else 0
-                
-                result += f"• **{project_name_display}**: {hours}h {minutes}m ({percentage:.1f}%)\n"
-            
-            # Grand total
-            total_hours = grand_total // 3600
-            total_minutes = (grand_total % 3600) // 60
-            result += f"\n**Total Time: {total_hours}h {total_minutes}m**\n"
-            
-            return result
-            
+
+            if projects_task is not None:
+                projects = await projects_task
+        except BaseException:
+            if projects_task is not None:
+                projects_task.cancel()
+            raise
+
+        if not entry_count:
+            date_range = f"from {start_date} to {end_date}"
+            if project_name:
+                date_range += f" for project '{project_name}'"
+            return f"No time entries found {date_range}."
+
+        # Translate ids to display names, merging entries without a project
+        project_map = {p.get("id"): p.get("name", "Unknown") for p in projects}
+        project_totals = {}
+        for project_id, total_seconds in id_totals.items():
+            project_name_display = project_map.get(project_id, "No project")
+            project_totals[project_name_display] = project_totals.get(project_name_display, 0) + total_seconds
+
+        # Format the summary
+        parts = [f"Time Summary ({start_date} to {end_date}):\n\n"]
+
+        # Sort projects by time spent (descending)
+        sorted_projects = sorted(project_totals.items(), key=lambda x: x[1], reverse=True)
+
+        for project_name_display, total_seconds in sorted_projects:
+            percentage = (total_seconds / grand_total * 100) if grand_total > 0 else 0
+
+            parts.append(f"• **{project_name_display}**: {_fmt_hm(total_seconds)} ({percentage:.1f}%)\n")
+
+        # Grand total
+        parts.append(f"\n**Total Time: {_fmt_hm(grand_total)}**\n")
+
+        return "".join(parts)
+
     except ValueError as e:
         return f"Configuration error: {str(e)}"
     except Exception as e:
@@ -518,48 +714,54 @@ async def get_current_timer() -> str:
     Returns details about the active time entry or indicates no timer is running.
     """
     try:
-        api_token = get_api_token()
-        
-        async with TogglClient(api_token) as client:
+        client = await get_client()
+
+        # Speculatively fetch projects while the current entry loads; the
+        # task is cancelled if the entry turns out not to need them
+        projects_task = asyncio.create_task(get_projects_cached(client))
+        try:
             current_entry = await client.get_current_time_entry()
-            
-            if not current_entry:
-                return "No timer is currently running."
-            
-            description = current_entry.get("description", "No description")
-            start_time = current_entry.get("start", "")
-            
-            # Get project name
-            project_id = current_entry.get("project_id")
-            project_name = "No project"
-            
-            if project_id:
-                projects = await client.get_projects()
-                for project in projects:
-                    if project.get("id") == project_id:
-                        project_name = project.get("name", "Unknown project")
-                        break
-            
-            # Calculate duration
-            if start_time:
-                start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                now = datetime.now(start_dt.tzinfo)
-                duration = now - start_dt
-                
-                hours = int(duration.total_seconds() // 3600)
-                minutes = int((duration.total_seconds() % 3600) // 60)
-                duration_str = f"{hours}h {minutes}m"
-            else:
-                duration_str = "Unknown duration"
-            
-            result = f"**Currently Running Timer:**\n\n"
-            result += f"• **Project**: {project_name}\n"
-            result += f"• **Description**: {description}\n"
-            result += f"• **Duration**: {duration_str}\n"
-            result += f"• **Started**: {start_time[:16].replace('T', ' ') if start_time else 'Unknown'}\n"
-            
-            return result
-            
+        except BaseException:
+            projects_task.cancel()
+            raise
+
+        if not current_entry:
+            projects_task.cancel()
+            return "No timer is currently running."
+
+        description = current_entry.get("description", "No description")
+        start_time = current_entry.get("start", "")
+
+        # Get project name
+        project_id = current_entry.get("project_id")
+        project_name = "No project"
+
+        if project_id:
+            projects = await projects_task
+            id_to_name = {p.get("id"): p.get("name", "Unknown project") for p in projects}
+            project_name = id_to_name.get(project_id, "No project")
+        else:
+            projects_task.cancel()
+
+        # Calculate duration with plain epoch math; Toggl timestamps are
+        # always UTC ISO-8601, so full tz-aware datetime parsing is overkill
+        if start_time:
+            start_epoch = calendar.timegm(time.strptime(start_time[:19], "%Y-%m-%dT%H:%M:%S"))
+            elapsed = int(time.time()) - start_epoch
+            duration_str = _fmt_hm(elapsed)
+        else:
+            duration_str = "Unknown duration"
+
+        parts = [
+            f"**Currently Running Timer:**\n\n",
+            f"• **Project**: {project_name}\n",
+            f"• **Description**: {description}\n",
+            f"• **Duration**: {duration_str}\n",
+            f"• **Started**: {start_time[:16].replace('T', ' ') if start_time else 'Unknown'}\n",
+        ]
+
+        return "".join(parts)
+
     except ValueError as e:
         return f"Configuration error: {str(e)}"
     except Exception as e:
@@ -578,47 +780,48 @@ async def start_timer(description: str, project_name: str = "") -> str:
     Returns confirmation of timer start with details.
     """
     try:
-        api_token = get_api_token()
-        
-        async with TogglClient(api_token) as client:
-            # Get workspaces to find the primary one
-            workspaces = await client.get_workspaces()
-            if not workspaces:
-                return "No workspaces found. Cannot start timer."
-            
-            # Use the first workspace (most users have one)
-            workspace_id = workspaces[0].get("id")
-            workspace_name = workspaces[0].get("name", "Unknown")
-            
-            # Get project ID if project name specified
-            project_id = None
-            if project_name:
-                projects = await client.get_projects()
-                for project in projects:
-                    if project.get("name") == project_name:
-                        project_id = project.get("id")
-                        break
-                
-                if not project_id:
-                    available_projects = [p.get("name", "") for p in projects]
-                    return f"Project '{project_name}' not found. Available projects: {', '.join(available_projects)}"
-            
-            # Start the timer
-            result = await client.start_timer(workspace_id, description, project_id)
-            
-            # Format response
-            timer_id = result.get("id")
-            start_time = result.get("start", "")[:16].replace("T", " ") if result.get("start") else ""
-            
-            response = f"**Timer Started Successfully!**\n\n"
-            response += f"• **Description**: {description}\n"
-            response += f"• **Project**: {project_name if project_name else 'No project'}\n"
-            response += f"• **Workspace**: {workspace_name}\n"
-            response += f"• **Started**: {start_time}\n"
-            response += f"• **Timer ID**: {timer_id}\n"
-            
-            return response
-            
+        client = await get_client()
+        # Get workspaces to find the primary one
+        workspaces = await get_workspaces_cached(client)
+        if not workspaces:
+            return "No workspaces found. Cannot start timer."
+
+        # Use the first workspace (most users have one)
+        workspace_id = workspaces[0].get("id")
+        workspace_name = workspaces[0].get("name", "Unknown")
+
+        # Get project ID if project name specified
+        project_id = None
+        if project_name:
+            projects = await get_projects_cached(client)
+            name_to_id = {p.get("name"): p.get("id") for p in projects}
+            project_id = name_to_id.get(project_name)
+
+            if not project_id:
+                available_projects = [p.get("name", "") for p in projects]
+                return f"Project '{project_name}' not found. Available projects: {', '.join(available_projects)}"
+
+        # Start the timer
+        result = await client.start_timer(workspace_id, description, project_id)
+
+        # Drop cached metadata so the write is reflected on the next read
+        _metadata_cache.pop("projects", None)
+
+        # Format response
+        timer_id = result.get("id")
+        start_time = result.get("start", "")[:16].replace("T", " ") if result.get("start") else ""
+
+        parts = [
+            f"**Timer Started Successfully!**\n\n",
+            f"• **Description**: {description}\n",
+            f"• **Project**: {project_name if project_name else 'No project'}\n",
+            f"• **Workspace**: {workspace_name}\n",
+            f"• **Started**: {start_time}\n",
+            f"• **Timer ID**: {timer_id}\n",
+        ]
+
+        return "".join(parts)
+
     except ValueError as e:
         return f"Configuration error: {str(e)}"
     except Exception as e:
@@ -633,66 +836,71 @@ async def stop_current_timer() -> str:
     Returns confirmation of timer stop with duration details.
     """
     try:
-        api_token = get_api_token()
-        
-        async with TogglClient(api_token) as client:
-            # Get current running timer
-            current_entry = await client.get_current_time_entry()
-            
-            if not current_entry:
-                return "No timer is currently running."
-            
-            # Get workspace info
-            workspaces = await client.get_workspaces()
-            workspace_id = None
-            workspace_name = "Unknown"
-            
-            entry_workspace_id = current_entry.get("workspace_id")
-            for workspace in workspaces:
-                if workspace.get("id") == entry_workspace_id:
-                    workspace_id = entry_workspace_id
-                    workspace_name = workspace.get("name", "Unknown")
-                    break
-            
-            if not workspace_id:
-                return "Could not determine workspace for current timer."
-            
-            # Stop the timer
-            time_entry_id = current_entry.get("id")
-            result = await client.stop_timer(workspace_id, time_entry_id)
-            
-            # Calculate duration
-            description = current_entry.get("description", "No description")
-            start_time = current_entry.get("start", "")
-            stop_time = result.get("stop", "")
-            duration = result.get("duration", 0)
-            
-            if duration > 0:
-                hours = duration // 3600
-                minutes = (duration % 3600) // 60
-                duration_str = f"{hours}h {minutes}m"
-            else:
-                duration_str = "Unknown duration"
-            
-            # Get project name
-            project_id = current_entry.get("project_id")
-            project_name = "No project"
-            if project_id:
-                projects = await client.get_projects()
-                for project in projects:
-                    if project.get("id") == project_id:
-                        project_name = project.get("name", "Unknown project")
-                        break
-            
-            response = f"**Timer Stopped Successfully!**\n\n"
-            response += f"• **Description**: {description}\n"
-            response += f"• **Project**: {project_name}\n"
-            response += f"• **Duration**: {duration_str}\n"
-            response += f"• **Started**: {start_time[:16].replace('T', ' ') if start_time else 'Unknown'}\n"
-            response += f"• **Stopped**: {stop_time[:16].replace('T', ' ') if stop_time else 'Unknown'}\n"
-            
-            return response
-            
+        client = await get_client()
+
+        # Speculatively fetch projects alongside the current timer and
+        # workspace list; it is cancelled if the entry has no project
+        projects_task = asyncio.create_task(get_projects_cached(client))
+        try:
+            # The current timer and workspace list are independent fetches
+            current_entry, workspaces = await asyncio.gather(
+                client.get_current_time_entry(),
+                get_workspaces_cached(client)
+            )
+        except BaseException:
+            projects_task.cancel()
+            raise
+
+        if not current_entry or not current_entry.get("project_id"):
+            projects_task.cancel()
+
+        if not current_entry:
+            return "No timer is currently running."
+
+        workspace_id = None
+        workspace_name = "Unknown"
+
+        entry_workspace_id = current_entry.get("workspace_id")
+        for workspace in workspaces:
+            if workspace.get("id") == entry_workspace_id:
+                workspace_id = entry_workspace_id
+                workspace_name = workspace.get("name", "Unknown")
+                break
+
+        if not workspace_id:
+            return "Could not determine workspace for current timer."
+
+        # Stop the timer
+        time_entry_id = current_entry.get("id")
+        result = await client.stop_timer(workspace_id, time_entry_id)
+
+        # Calculate duration
+        description = current_entry.get("description", "No description")
+        start_time = current_entry.get("start", "")
+        stop_time = result.get("stop", "")
+        duration = result.get("duration", 0)
+
+        duration_str = _fmt_hm(duration) if duration > 0 else "Unknown duration"
+
+        # Get project name
+        project_id = current_entry.get("project_id")
+        project_name = "No project"
+        if project_id:
+            projects = await projects_task
+            id_to_name = {p.get("id"): p.get("name", "Unknown project") for p in projects}
+            project_name = id_to_name.get(project_id, "No project")
+
+        parts = [
+            f"**Timer Stopped Successfully!**\n\n",
+            f"• **Description**: {description}\n",
+            f"• **Project**: {project_name}\n",
+            f"• **Duration**: {duration_str}\n",
+            f"• **Started**: {start_time[:16].replace('T', ' ') if start_time else 'Unknown'}\n",
+            f"• **Stopped**: {stop_time[:16].replace('T', ' ') if stop_time else 'Unknown'}\n",
+        ]
+
+        return "".join(parts)
+
     except ValueError as e:
         return f"Configuration error: {str(e)}"
     except Exception as e:
@@ -712,97 +920,73 @@ async def search_time_entries(query: str, start_date: str = "", end_date: str =
     Returns time entries matching the search query.
     """
     try:
-        api_token = get_api_token()
-        
         # Set default date range if not provided (last 30 days for search)
-        if not start_date and not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
-            start_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-        elif not start_date:
-            start_date = (datetime.strptime(end_date, "%Y-%m-%d") - timedelta(days=30)).strftime("%Y-%m-%d")
-        elif not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
+        start_date, end_date = _resolve_date_range(start_date, end_date, 30)
         
-        async with TogglClient(api_token) as client:
-            # Get projects for display names
-            projects = await client.get_projects()
-            project_map = {p.get("id"): p.get("name", "Unknown") for p in projects}
-            
-            # Get time entries
-            entries = await client.get_time_entries(start_date, end_date)
-            
-            if not entries:
-                return f"No time entries found from {start_date} to {end_date}."
-            
-            # Filter entries by description query (case-insensitive)
-            matching_entries = []
-            query_lower = query.lower()
-            
-            for entry in entries:
-                description = entry.get("description", "").lower()
-                if query_lower in description:
-                    matching_entries.append(entry)
-            
-            if not matching_entries:
-                return f"No time entries found matching '{query}' from {start_date} to {end_date}."
-            
-            # Format the matching entries
-            result = f"Time Entries matching '{query}' ({start_date} to {end_date}):\n\n"
-            
-            # Group entries by date
-            entries_by_date = {}
-            for entry in matching_entries:
-                start_time = entry.get("start", "")
-                date = start_time[:10] if start_time else "Unknown date"
-                if date not in entries_by_date:
-                    entries_by_date[date] = []
-                entries_by_date[date].append(entry)
-            
-            total_matching_time = 0
-            
-            # Sort dates and display
-            for date in sorted(entries_by_date.keys()):
-                result += f"**{date}**\n"
-                daily_total = 0
-                
-                for entry in entries_by_date[date]:
-                    description = entry.get("description", "No description")
-                    duration = entry.get("duration", 0)
-                    
-                    # Convert duration from seconds to hours and minutes
-                    if duration > 0:
-                        hours = duration // 3600
-                        minutes = (duration % 3600) // 60
-                        duration_str = f"{hours}h {minutes}m"
-                        daily_total += duration
-                        total_matching_time += duration
-                    else:
-                        duration_str = "Running"
-                    
-                    # Get project name
-                    project_id = entry.get("project_id")
-                    project_name = project_map.get(project_id, "No project")
-                    
-                    start_time = entry.get("start", "")[:16].replace("T", " ") if entry.get("start") else ""
-                    
-                    result += f"  • {start_time} | {project_name} | {description} | {duration_str}\n"
-                
-                # Daily total for matching entries
-                if daily_total > 0:
-                    daily_hours = daily_total // 3600
-                    daily_minutes = (daily_total % 3600) // 60
-                    result += f"  **Daily Total: {daily_hours}h {daily_minutes}m**\n"
-                
-                result += "\n"
-            
-            # Overall total for matching entries
-            if total_matching_time > 0:
-                total_hours = total_matching_time // 3600
-                total_minutes = (total_matching_time % 3600) // 60
-                result += f"**Total Time for '{query}': {total_hours}h {total_minutes}m**\n"
-            
-            return result
-            
+        client = await get_client()
+        # Get projects for display names
+        projects = await get_projects_cached(client)
+        project_map = {p.get("id"): p.get("name", "Unknown") for p in projects}
+
+        # Get time entries
+        entries = await client.get_time_entries(start_date, end_date)
+
+        if not entries:
+            return f"No time entries found from {start_date} to {end_date}."
+
+        # Filter entries by description query; a compiled case-insensitive
+        # pattern avoids allocating a lowercased copy of every description
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        matching_entries = [entry for entry in entries if pattern.search(entry.get("description") or "")]
+
+        if not matching_entries:
+            return f"No time entries found matching '{query}' from {start_date} to {end_date}."
+
+        # Format the matching entries
+        parts = [f"Time Entries matching '{query}' ({start_date} to {end_date}):\n\n"]
+
+        total_matching_time = 0
+
+        # Sort once and stream groups of consecutive dates rather than
+        # building an intermediate per-date dict
+        matching_entries.sort(key=_entry_start)
+        for date, day_entries in itertools.groupby(matching_entries, key=_entry_date):
+            parts.append(f"**{date}**\n")
+            daily_total = 0
+
+            for entry in day_entries:
+                description = entry.get("description", "No description")
+                duration = entry.get("duration", 0)
+
+                if duration > 0:
+                    duration_str = _fmt_hm(duration)
+                    daily_total += duration
+                    total_matching_time += duration
+                else:
+                    duration_str = "Running"
+
+                # Get project name
+                project_id = entry.get("project_id")
+                project_name = project_map.get(project_id, "No project")
+
+                # Single fetch of "start", single replace (ISO-8601 has one 'T')
+                s = entry.get("start") or ""
+                start_display = s[:16].replace("T", " ", 1)
+
+                parts.append(f"  • {start_display} | {project_name} | {description} | {duration_str}\n")
+
+            # Daily total for matching entries
+            if daily_total > 0:
+                parts.append(f"  **Daily Total: {_fmt_hm(daily_total)}**\n")
+
+            parts.append("\n")
+
+        # Overall total for matching entries
+        if total_matching_time > 0:
+            parts.append(f"**Total Time for '{query}': {_fmt_hm(total_matching_time)}**\n")
+
+        return "".join(parts)
+
     except ValueError as e:
         return f"Configuration error: {str(e)}"
     except Exception as e:
@@ -823,114 +1007,75 @@ async def get_time_entries_fixed(start_date: str = "", end_date: str = "", proje
     This version handles single-day queries better than get_time_entries.
     """
     try:
-        api_token = get_api_token()
-        
         # Set default date range if not provided
-        if not start_date and not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
-            start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-        elif not start_date:
-            start_date = (datetime.strptime(end_date, "%Y-%m-%d") - timedelta(days=7)).strftime("%Y-%m-%d")
-        elif not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
-        
-        # Store original dates for display
-        original_start = start_date
-        original_end = end_date
-        
-        # Handle single-day queries by expanding the range for API call
-        if start_date == end_date:
-            # Query a wider range and filter results later
-            api_start_date = (datetime.strptime(start_date, "%Y-%m-%d") - timedelta(days=2)).strftime("%Y-%m-%d")
-            api_end_date = (datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=2)).strftime("%Y-%m-%d")
-            single_day_filter = start_date
-        else:
-            api_start_date = start_date
-            api_end_date = end_date
-            single_day_filter = None
-        
-        async with TogglClient(api_token) as client:
-            # Get projects first to match project names to IDs
-            projects = await client.get_projects()
-            project_map = {p.get("name", ""): p.get("id") for p in projects}
+        start_date, end_date = _resolve_date_range(start_date, end_date, 7)
+
+        # Toggl treats end_date as exclusive, so push it one day forward
+        # to keep the requested end date (and single-day queries) inclusive
+        api_end_date = _ymd(datetime.fromisoformat(end_date) + timedelta(days=1))
+
+        client = await get_client()
+        # Get projects first to match project names to IDs
+        projects = await get_projects_cached(client)
+        project_map = {p.get("name", ""): p.get("id") for p in projects}
+        project_id_map = {p.get("id"): p.get("name", "Unknown project") for p in projects}
+
+        # Filter by project if specified
+        project_ids = None
+        if project_name:
+            project_id = project_map.get(project_name)
+            if project_id:
+                project_ids = [project_id]
+            else:
+                return f"Project '{project_name}' not found. Available projects: {_project_names_preview(project_map.keys())}"
             
-            # Filter by project if specified
-            project_ids = None
+        # Let the API do the date filtering instead of over-fetching
+        # and re-filtering in Python
+        entries = await client.get_time_entries(start_date, api_end_date, project_ids)
+
+        if not entries:
+            date_range = f"from {start_date} to {end_date}"
             if project_name:
-                project_id = project_map.get(project_name)
-                if project_id:
-                    project_ids = [project_id]
+                date_range += f" for project '{project_name}'"
+            return f"No time entries found {date_range}."
+            
+        # Format the entries for display
+        parts = [f"Time Entries ({start_date} to {end_date}):\n\n"]
+            
+        # Sort once and stream groups of consecutive dates; no
+        # intermediate per-date dicts, and the sort is near-O(N) since
+        # the API already returns entries in date order
+        entries.sort(key=_entry_start)
+        for date, day_entries in itertools.groupby(entries, key=_entry_date):
+            parts.append(f"**{date}**\n")
+            daily_total = 0
+
+            for entry in day_entries:
+                description = entry.get("description", "No description")
+                duration = entry.get("duration", 0)
+
+                if duration > 0:
+                    duration_str = _fmt_hm(duration)
+                    daily_total += duration
                 else:
-                    return f"Project '{project_name}' not found. Available projects: {', '.join(project_map.keys())}"
-            
-            # Get time entries using potentially expanded date range
-            entries = await client.get_time_entries(api_start_date, api_end_date, project_ids)
-            
-            # Filter to the requested date range
-            if single_day_filter:
-                entries = [entry for entry in entries if entry.get("start", "")[:10] == single_day_filter]
-            elif original_start != api_start_date or original_end != api_end_date:
-                # Filter to original date range if we expanded it
-                entries = [entry for entry in entries 
-                          if original_start <= entry.get("start", "")[:10] <= original_end]
-            
-            if not entries:
-                date_range = f"from {original_start} to {original_end}"
-                if project_name:
-                    date_range += f" for project '{project_name}'"
-                return f"No time entries found {date_range}."
-            
-            # Format the entries for display
-            result = f"Time Entries ({original_start} to {original_end}):\n\n"
-            
-            # Group entries by date
-            entries_by_date = {}
-            for entry in entries:
-                start_time = entry.get("start", "")
-                date = start_time[:10] if start_time else "Unknown date"
-                if date not in entries_by_date:
-                    entries_by_date[date] = []
-                entries_by_date[date].append(entry)
-            
-            # Sort dates
-            for date in sorted(entries_by_date.keys()):
-                result += f"**{date}**\n"
-                daily_total = 0
-                
-                for entry in entries_by_date[date]:
-                    description = entry.get("description", "No description")
-                    duration = entry.get("duration", 0)
-                    
-                    # Convert duration from seconds to hours and minutes
-                    if duration > 0:
-                        hours = duration // 3600
-                        minutes = (duration % 3600) // 60
-                        duration_str = f"{hours}h {minutes}m"
-                        daily_total += duration
-                    else:
-                        duration_str = "Running"
-                    
-                    # Get project name
-                    project_id = entry.get("project_id")
-                    project_name_display = "No project"
-                    for project in projects:
-                        if project.get("id") == project_id:
-                            project_name_display = project.get("name", "Unknown project")
-                            break
-                    
-                    start_time = entry.get("start", "")[:16].replace("T", " ") if entry.get("start") else ""
-                    
-                    result += f"  • {start_time} | {project_name_display} | {description} | {duration_str}\n"
-                
-                # Daily total
-                if daily_total > 0:
-                    total_hours = daily_total // 3600
-                    total_minutes = (daily_total % 3600) // 60
-                    result += f"  **Daily Total: {total_hours}h {total_minutes}m**\n"
-                
-                result += "\n"
+                    duration_str = "Running"
+
+                # Get project name from the precomputed id->name map
+                project_name_display = project_id_map.get(entry.get("project_id"), "No project")
+
+                # Single fetch of "start", single replace (ISO-8601 has one 'T')
+                s = entry.get("start") or ""
+                start_display = s[:16].replace("T", " ", 1)
+
+                parts.append(f"  • {start_display} | {project_name_display} | {description} | {duration_str}\n")
+
+            # Daily total
+            if daily_total > 0:
+                parts.append(f"  **Daily Total: {_fmt_hm(daily_total)}**\n")
+
+            parts.append("\n")
             
-            return result
+        return "".join(parts)
             
     except ValueError as e:
         return f"Configuration error: {str(e)}"
@@ -949,62 +1094,53 @@ async def get_project_tasks(project_name: str) -> str:
     Returns list of tasks with their details.
     """
     try:
-        api_token = get_api_token()
-        
-        async with TogglClient(api_token) as client:
-            # Get workspaces and projects
-            workspaces = await client.get_workspaces()
-            projects = await client.get_projects()
+        client = await get_client()
+        # Get workspaces and projects
+        workspaces = await get_workspaces_cached(client)
+        projects = await get_projects_cached(client)
             
-            if not workspaces:
-                return "No workspaces found."
+        if not workspaces:
+            return "No workspaces found."
             
-            # Find the project
-            project_id = None
-            project_found = None
-            for project in projects:
-                if project.get("name") == project_name:
-                    project_id = project.get("id")
-                    project_found = project
-                    break
-            
-            if not project_id:
-                available_projects = [p.get("name", "") for p in projects]
-                return f"Project '{project_name}' not found. Available projects: {', '.join(available_projects)}"
+        # Find the project via a name index instead of a linear scan
+        projects_by_name = {p.get("name", ""): p for p in projects}
+        project_found = projects_by_name.get(project_name)
+        project_id = project_found.get("id") if project_found else None
+
+        if not project_id:
+            return f"Project '{project_name}' not found. Available projects: {_project_names_preview(projects_by_name)}"
             
-            # Get workspace ID for the project
-            workspace_id = project_found.get("workspace_id")
-            if not workspace_id:
-                return f"Could not determine workspace for project '{project_name}'."
+        # Get workspace ID for the project
+        workspace_id = project_found.get("workspace_id")
+        if not workspace_id:
+            return f"Could not determine workspace for project '{project_name}'."
             
-            # Get tasks for the project
-            tasks = await client.get_tasks(workspace_id, project_id)
+        # Get tasks for the project
+        tasks = await get_tasks_cached(client, workspace_id, project_id)
             
-            if not tasks:
-                return f"No tasks found for project '{project_name}'."
+        if not tasks:
+            return f"No tasks found for project '{project_name}'."
             
-            # Format the tasks
-            result = f"Tasks for project '{project_name}':\n\n"
+        # Format the tasks
+        parts = [f"Tasks for project '{project_name}':\n\n"]
             
-            for task in tasks:
-                name = task.get("name", "Unnamed Task")
-                task_id = task.get("id", "Unknown")
-                active = task.get("active", True)
-                estimated_seconds = task.get("estimated_seconds")
+        for task in tasks:
+            name = task.get("name", "Unnamed Task")
+            task_id = task.get("id", "Unknown")
+            active = task.get("active", True)
+            estimated_seconds = task.get("estimated_seconds")
                 
-                status = "Active" if active else "Inactive"
+            status = "Active" if active else "Inactive"
                 
-                result += f"• **{name}** (ID: {task_id})\n"
-                result += f"  - Status: {status}\n"
+            parts.append(f"• **{name}** (ID: {task_id})\n")
+            parts.append(f"  - Status: {status}\n")
                 
-                if estimated_seconds:
-                    hours = estimated_seconds // 3600
-                    minutes = (estimated_seconds % 3600) // 60
-                    result += f"  - Estimated: {hours}h {minutes}m\n"
+            if estimated_seconds:
+                parts.append(f"  - Estimated: {_fmt_hm(estimated_seconds)}\n")
                 
-                result += "\n"
+            parts.append("\n")
             
-            return result
+        return "".join(parts)
             
     except ValueError as e:
         return f"Configuration error: {str(e)}"
@@ -1025,57 +1161,54 @@ async def create_project_task(project_name: str, task_name: str, estimated_hours
     Returns confirmation of task creation.
     """
     try:
-        api_token = get_api_token()
-        
-        async with TogglClient(api_token) as client:
-            # Get workspaces and projects
-            workspaces = await client.get_workspaces()
-            projects = await client.get_projects()
-            
-            if not workspaces:
-                return "No workspaces found."
+        client = await get_client()
+        # Get workspaces and projects
+        workspaces = await get_workspaces_cached(client)
+        projects = await get_projects_cached(client)
             
-            # Find the project
-            project_id = None
-            project_found = None
-            for project in projects:
-                if project.get("name") == project_name:
-                    project_id = project.get("id")
-                    project_found = project
-                    break
+        if not workspaces:
+            return "No workspaces found."
             
-            if not project_id:
-                available_projects = [p.get("name", "") for p in projects]
-                return f"Project '{project_name}' not found. Available projects: {', '.join(available_projects)}"
-            
-            # Get workspace ID for the project
-            workspace_id = project_found.get("workspace_id")
-            if not workspace_id:
-                return f"Could not determine workspace for project '{project_name}'."
+        # Find the project via a name index instead of a linear scan
+        projects_by_name = {p.get("name", ""): p for p in projects}
+        project_found = projects_by_name.get(project_name)
+        project_id = project_found.get("id") if project_found else None
+
+        if not project_id:
+            return f"Project '{project_name}' not found. Available projects: {_project_names_preview(projects_by_name)}"
             
-            # Convert estimated hours to seconds
-            estimated_seconds = None
-            if estimated_hours > 0:
-                estimated_seconds = int(estimated_hours * 3600)
+        # Get workspace ID for the project
+        workspace_id = project_found.get("workspace_id")
+        if not workspace_id:
+            return f"Could not determine workspace for project '{project_name}'."
             
-            # Create the task
-            result = await client.create_task(workspace_id, project_id, task_name, estimated_seconds)
+        # Convert estimated hours to seconds
+        estimated_seconds = None
+        if estimated_hours > 0:
+            estimated_seconds = int(estimated_hours * 3600)
             
-            # Format response
-            task_id = result.get("id")
-            active = result.get("active", True)
-            status = "Active" if active else "Inactive"
+        # Create the task
+        result = await client.create_task(workspace_id, project_id, task_name, estimated_seconds)
+
+        # Drop cached task metadata so the write is reflected on the next read
+        _metadata_cache.pop(f"tasks:{workspace_id}:{project_id}", None)
+        _metadata_cache.pop("projects", None)
+
+        # Format response
+        task_id = result.get("id")
+        active = result.get("active", True)
+        status = "Active" if active else "Inactive"
             
-            response = f"**Task Created Successfully!**\n\n"
-            response += f"• **Task Name**: {task_name}\n"
-            response += f"• **Project**: {project_name}\n"
-            response += f"• **Task ID**: {task_id}\n"
-            response += f"• **Status**: {status}\n"
+        parts = [f"**Task Created Successfully!**\n\n"]
+        parts.append(f"• **Task Name**: {task_name}\n")
+        parts.append(f"• **Project**: {project_name}\n")
+        parts.append(f"• **Task ID**: {task_id}\n")
+        parts.append(f"• **Status**: {status}\n")
             
-            if estimated_hours > 0:
-                response += f"• **Estimated Time**: {estimated_hours}h\n"
+        if estimated_hours > 0:
+            parts.append(f"• **Estimated Time**: {estimated_hours}h\n")
             
-            return response
+        return "".join(parts)
             
     except ValueError as e:
         return f"Configuration error: {str(e)}"
@@ -1091,71 +1224,86 @@ async def get_all_tasks() -> str:
     Returns a comprehensive list of all tasks organized by project.
     """
     try:
-        api_token = get_api_token()
-        
-        async with TogglClient(api_token) as client:
-            # Get workspaces and projects
-            workspaces = await client.get_workspaces()
-            projects = await client.get_projects()
-            
-            if not workspaces:
-                return "No workspaces found."
-            
-            if not projects:
-                return "No projects found."
-            
-            # Group projects by workspace for organization
-            workspace_map = {ws.get("id"): ws.get("name", "Unknown") for ws in workspaces}
-            
-            result = "All Tasks Across Projects:\n\n"
-            total_tasks = 0
-            
-            for project in projects:
-                project_name = project.get("name", "Unnamed Project")
-                project_id = project.get("id")
-                workspace_id = project.get("workspace_id")
-                
-                if not project_id or not workspace_id:
-                    continue
-                
+        client = await get_client()
+        # Get workspaces and projects
+        workspaces = await get_workspaces_cached(client)
+        projects = await get_projects_cached(client)
+            
+        if not workspaces:
+            return "No workspaces found."
+            
+        if not projects:
+            return "No projects found."
+            
+        # Group projects by workspace for organization
+        workspace_map = {ws.get("id"): ws.get("name", "Unknown") for ws in workspaces}
+            
+        parts = ["All Tasks Across Projects:\n\n"]
+        total_tasks = 0
+
+        targets = [
+            (
+                p.get("workspace_id"),
+                p.get("id"),
+                p.get("name", "Unnamed Project"),
+                workspace_map.get(p.get("workspace_id"), "Unknown Workspace"),
+            )
+            for p in projects
+            if p.get("id") and p.get("workspace_id")
+        ]
+
+        # Fetch every project's tasks concurrently; a small semaphore
+        # keeps the fan-out within Toggl's rate-limit comfort zone
+        semaphore = asyncio.Semaphore(4)
+
+        async def fetch_tasks(workspace_id, project_id):
+            key = (workspace_id, project_id)
+            if _no_tasks_cache.get(key, 0.0) > time.monotonic():
+                return []
+            async with semaphore:
                 try:
-                    # Get tasks for this project
-                    tasks = await client.get_tasks(workspace_id, project_id)
-                    
-                    if tasks:
-                        # Add project header
-                        result += f"**{project_name}** ({workspace_map.get(workspace_id, 'Unknown Workspace')})\n"
-                        
-                        for task in tasks:
-                            name = task.get("name", "Unnamed Task")
-                            task_id = task.get("id", "Unknown")
-                            active = task.get("active", True)
-                            estimated_seconds = task.get("estimated_seconds")
-                            
-                            status = "Active" if active else "Inactive"
-                            
-                            result += f"  • **{name}** (ID: {task_id})\n"
-                            result += f"    - Status: {status}\n"
-                            
-                            if estimated_seconds:
-                                hours = estimated_seconds // 3600
-                                minutes = (estimated_seconds % 3600) // 60
-                                result += f"    - Estimated: {hours}h {minutes}m\n"
-                            
-                            total_tasks += 1
-                        
-                        result += "\n"
-                        
-                except Exception as e:
-                    # Skip projects that can't be accessed (might not have tasks enabled)
-                    continue
+                    return await get_tasks_cached(client, workspace_id, project_id)
+                except Exception:
+                    _no_tasks_cache[key] = time.monotonic() + NO_TASKS_TTL
+                    raise
+
+        results = await asyncio.gather(
+            *(fetch_tasks(ws, pid) for ws, pid, _, _ in targets),
+            return_exceptions=True
+        )
+
+        for (workspace_id, project_id, project_name, ws_name), tasks in zip(targets, results):
+            # Skip projects that can't be accessed (might not have tasks enabled)
+            if isinstance(tasks, Exception) or not tasks:
+                continue
+
+            # Add project header
+            parts.append(f"**{project_name}** ({ws_name})\n")
+
+            for task in tasks:
+                name = task.get("name", "Unnamed Task")
+                task_id = task.get("id", "Unknown")
+                active = task.get("active", True)
+                estimated_seconds = task.get("estimated_seconds")
+
+                status = "Active" if active else "Inactive"
+
+                parts.append(f"  • **{name}** (ID: {task_id})\n")
+                parts.append(f"    - Status: {status}\n")
+
+                if estimated_seconds:
+                    parts.append(f"    - Estimated: {_fmt_hm(estimated_seconds)}\n")
+
+                total_tasks += 1
+
+            parts.append("\n")
             
-            if total_tasks == 0:
-                return "No tasks found across any projects."
+        if total_tasks == 0:
+            return "No tasks found across any projects."
             
-            result += f"**Total Tasks Found: {total_tasks}**\n"
+        parts.append(f"**Total Tasks Found: {total_tasks}**\n")
             
-            return result
+        return "".join(parts)
             
     except ValueError as e:
         return f"Configuration error: {str(e)}"
@@ -1173,10 +1321,20 @@ def start_time_tracking(project_name: str, description: str = "") -> str:
     return prompt
 
 
+# Constant prompt texts, built once at import instead of per call
+_WEEKLY_TIME_REPORT_PROMPT = "Please generate a weekly time report showing my time entries, total hours worked, and project breakdown for this week using my Toggl Track data."
+_OPTIMIZE_WORKFLOW_PROMPT = "Based on my Toggl Track time tracking data, please analyze my work patterns and suggest ways to optimize my workflow and improve productivity."
+_PROJECT_OVERVIEW_PROMPT = "Please show me all my Toggl Track projects and workspaces, organized in a clear format with project details and current status."
+_CURRENT_STATUS_CHECK_PROMPT = "Please check my current timer status and show me what I've been working on today."
+_TIMER_STATUS_AND_CONTROL_PROMPT = "Please check my current timer status. If I have a timer running, show me the details and ask if I want to stop it. If no timer is running, ask if I want to start one."
+_PROJECT_TASK_OVERVIEW_PROMPT = "Please give me an overview of tasks across all my projects. Show me which projects have tasks, what needs attention, and help me prioritize my work."
+_LIST_ALL_TASKS_PROMPT = "Please show me all tasks across all my projects, organized by project. Include task status and estimated time for each task."
+
+
 @mcp.prompt()
 def weekly_time_report() -> str:
     """Generate a prompt to request a weekly time report"""
-    return "Please generate a weekly time report showing my time entries, total hours worked, and project breakdown for this week using my Toggl Track data."
+    return _WEEKLY_TIME_REPORT_PROMPT
 
 
 @mcp.prompt()
@@ -1192,13 +1350,13 @@ def project_time_analysis(project_name: str) -> list[base.Message]:
 @mcp.prompt()
 def optimize_workflow() -> str:
     """Generate a prompt for workflow optimization based on time tracking data"""
-    return "Based on my Toggl Track time tracking data, please analyze my work patterns and suggest ways to optimize my workflow and improve productivity."
+    return _OPTIMIZE_WORKFLOW_PROMPT
 
 
 @mcp.prompt()
 def project_overview() -> str:
     """Generate a prompt to get an overview of all projects"""
-    return "Please show me all my Toggl Track projects and workspaces, organized in a clear format with project details and current status."
+    return _PROJECT_OVERVIEW_PROMPT
 
 
 @mcp.prompt()
@@ -1236,7 +1394,7 @@ def productivity_analysis(period: str = "week") -> list[base.Message]:
 @mcp.prompt()
 def current_status_check() -> str:
     """Generate a prompt to check current timer and recent activity"""
-    return "Please check my current timer status and show me what I've been working on today."
+    return _CURRENT_STATUS_CHECK_PROMPT
 
 
 @mcp.prompt()
@@ -1274,7 +1432,7 @@ def stop_and_start_new(new_description: str, project_name: str = "") -> str:
 @mcp.prompt()
 def timer_status_and_control() -> str:
     """Generate a prompt to check timer status and offer controls"""
-    return "Please check my current timer status. If I have a timer running, show me the details and ask if I want to stop it. If no timer is running, ask if I want to start one."
+    return _TIMER_STATUS_AND_CONTROL_PROMPT
 
 
 @mcp.prompt()
@@ -1308,16 +1466,23 @@ def task_planning_session(project_name: str) -> str:
 @mcp.prompt()
 def project_task_overview() -> str:
     """Generate a prompt for a comprehensive task overview across projects"""
-    return "Please give me an overview of tasks across all my projects. Show me which projects have tasks, what needs attention, and help me prioritize my work."
+    return _PROJECT_TASK_OVERVIEW_PROMPT
 
 
 @mcp.prompt()
 def list_all_tasks() -> str:
     """Generate a prompt to list all tasks across all projects"""
-    return "Please show me all tasks across all my projects, organized by project. Include task status and estimated time for each task."
+    return _LIST_ALL_TASKS_PROMPT
 
 
 if __name__ == "__main__":
     # This allows the server to be run directly for testing
     print("Running server...")
+    try:
+        # Warm the metadata caches so the first tool call doesn't pay
+        # for the projects/workspaces round-trips
+        asyncio.run(_prewarm())
+    except Exception:
+        # Prewarming is best-effort; the server must start regardless
+        pass
     mcp.run()
\ No newline at end of file